@@ -40,18 +40,45 @@ Dependencies:
     pip install opencv-python pillow
 """
 
+import os
 import sys
+import math
 import time
+import logging
+import threading
 import datetime as dt
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk, ImageDraw, ImageFont
+import tkinter.font as tkfont
+from PIL import Image, ImageTk, ImageDraw, ImageFont, ImageColor
 
-# Try importing cv2; if not available, fall back to placeholder image
+# numpy is cheap to import and also used for the placeholder vignette
 try:
-    import cv2
+    import numpy as np
 except Exception:
-    cv2 = None
+    np = None
+
+# Button/slider handlers log at DEBUG so routine interaction stays silent;
+# %-style args defer the string formatting until the record is actually
+# emitted, keeping the cost out of the event handlers
+log = logging.getLogger("smartpanel")
+log.setLevel(logging.INFO)
+
+# OpenCV's shared libraries weigh tens of MB; the import is deferred to the
+# first camera use (the probe thread) so startup never pays for it
+cv2 = None
+
+
+def _ensure_cv2():
+    """Import cv2 on first camera use; returns the module or None."""
+    global cv2
+    if cv2 is None:
+        try:
+            import cv2 as _cv2
+        except Exception:
+            return None
+        cv2 = _cv2
+    return cv2
 
 # -----------------------------
 # Color Palette (matching reference image)
@@ -73,6 +100,12 @@ COLORS = {
     "accent_blue": "#007AFF",
 }
 
+# Preformatted clock strings: spinning an alarm digit indexes a tuple
+# instead of re-running __format__ and allocating a new str per click
+_HOUR_STRS = tuple(f"{h:02d}" for h in range(24))
+_MIN_STRS = tuple(f"{m:02d}" for m in range(60))
+_TIME_STRS = tuple(f"{h}:{m}" for h in _HOUR_STRS for m in _MIN_STRS)
+
 FONT_CACHE = {}
 
 def get_font(size: int, bold=False):
@@ -91,6 +124,23 @@ def get_font(size: int, bold=False):
     FONT_CACHE[key] = font
     return font
 
+def _scroll_to_value(y, top, height):
+    """Map a pointer y inside a scrollbar track to a 0-100 value."""
+    p = (y - top) / height
+    v = int((1.0 - p) * 100.0)
+    return 0 if v < 0 else (100 if v > 100 else v)
+
+# Optional: numba compiles the drag math to native code, skipping the
+# per-event float boxing; the plain function above is the fallback. The
+# first call triggers (cached) compilation, so it is warmed off the UI
+# thread during startup.
+try:
+    from numba import njit
+    _scroll_to_value = njit(cache=True)(_scroll_to_value)
+except Exception:
+    pass
+
+
 class SmartPanelApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -102,6 +152,9 @@ class SmartPanelApp(tk.Tk):
         # State
         self.current_page = "camera"
         self.temp_c = 20.0
+        # Overlay date string, refreshed by the 1 Hz _update_time loop so
+        # per-frame overlay refreshes never call datetime.now()/strftime
+        self._date_str = dt.datetime.now().strftime("%d/%m/%Y")
         
         # Alarm page spinbox values - initialize with current time
         now = dt.datetime.now()
@@ -116,77 +169,112 @@ class SmartPanelApp(tk.Tk):
         # Camera recording state
         self.is_recording = False
 
+        # Overlay cache: static canvas items are built once per (page, size);
+        # _dyn_ids maps the few dynamic items to their canvas item ids
+        self._overlay_built_for = None
+        self._dyn_ids = {}
+
+        # Tk font cache, keyed (size, bold) - mirrors FONT_CACHE for PIL fonts
+        self._fonts = {}
+
+        # Hit-test rects (name -> (x1, y1, x2, y2)), filled at overlay build
+        # time so event handlers never re-derive geometry
+        self._hit_regions = {}
+        # Clickable regions as (x1, y1, x2, y2, callback) tuples, registered
+        # by the overlay builders for the current page
+        self._hit_targets = []
+        # Coarse 64px bucket grid over the same targets: maps
+        # (x >> 6, y >> 6) cells to indices into _hit_targets, so a click
+        # only tests the one or two rects sharing its cell
+        self._hit_grid = {}
+        # Drag events are coalesced: only the newest coordinate is applied,
+        # once per idle cycle
+        self._pending_drag = None
+        self._drag_scheduled = False
+
         # Video capture (graceful fallback if unavailable)
         self.cap = None
         self.camera_available = False
         self.placeholder_img = self._make_placeholder()
-        if cv2 is not None:
-            # Try different camera indices and backends
-            # For Mac: try AVFoundation backend first, index 0 is usually built-in, 1 is external
-            camera_configs = [
-                (0, cv2.CAP_AVFOUNDATION),  # Built-in camera with AVFoundation
-                (1, cv2.CAP_AVFOUNDATION),  # External/Continuity camera with AVFoundation
-                (0, cv2.CAP_ANY),           # Built-in camera with default backend
-                (1, cv2.CAP_ANY),           # External camera with default backend
-                (2, cv2.CAP_ANY),           # Third camera option
-            ]
-            
-            for cam_index, backend in camera_configs:
-                try:
-                    print(f"Trying to open camera {cam_index} with backend {backend}...")
-                    self.cap = cv2.VideoCapture(cam_index, backend)
-                    # Set a reasonable resolution (if supported)
-                    if self.cap is not None and self.cap.isOpened():
-                        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-                        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-                        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-                        
-                        # Warm up the camera by discarding first few frames
-                        print(f"Warming up camera {cam_index}...")
-                        for i in range(10):
-                            ret, test_frame = self.cap.read()
-                            time.sleep(0.1)
-                        
-                        # Test if we can actually read a valid frame
-                        ret, test_frame = self.cap.read()
-                        if ret and test_frame is not None and test_frame.size > 0:
-                            # Check if frame has actual data (not all black)
-                            mean_value = test_frame.mean()
-                            self.camera_available = True
-                            print(f"✓ Camera {cam_index} opened successfully!")
-                            print(f"  Resolution: {test_frame.shape[1]}x{test_frame.shape[0]}")
-                            print(f"  Frame mean value: {mean_value:.2f} (checking for actual image data)")
-                            if mean_value < 1.0:
-                                print(f"  ⚠ Warning: Camera might be showing black screen (very low brightness)")
-                            break
-                        else:
-                            print(f"✗ Camera {cam_index} opened but no valid frames")
-                            self.cap.release()
-                            self.cap = None
-                    else:
-                        self.cap = None
-                except Exception as e:
-                    print(f"✗ Camera {cam_index} failed: {e}")
-                    if self.cap is not None:
-                        try:
-                            self.cap.release()
-                        except:
-                            pass
-                    self.cap = None
-            
-            if not self.camera_available:
-                print("⚠ No camera available. Using placeholder image.")
+
+        # Capture worker: a daemon thread reads frames off the Tk main loop
+        # and parks the newest one in a single-slot buffer; _update_video just
+        # swaps it out non-blockingly so decode never stalls UI redraws
+        self._frame_lock = threading.Lock()
+        self._latest_frame = None
+        self._shown_frame = None
+        self._capture_running = False
+        self._capture_thread = None
+
+        # Persistent Tk photo buffer, reallocated only on widget resize
+        self._photo = None
+        self._photo_size = None
+        self._photo_is_placeholder = False
+
+        # PhotoImage currently shown by the canvas video item (kept as an
+        # attribute so Tk's reference to it can't be garbage collected)
+        self._video_photo = None
+
+        # Prebuilt letterboxed placeholder PhotoImage, cached per widget size
+        self._placeholder_tk = None
+        self._placeholder_tk_size = None
+
+        # Scrollbar icon sprites, rendered once on first overlay build
+        self._sun_icon_tk = None
+        self._mute_icon_tk = None
+
+        # Reusable composition/scratch buffers for the cv2 letterbox path
+        self._frame_canvas = None
+        self._resize_buf = None
+        self._rgb_buf = None
+
+        # Reused PIL canvas for the _letterbox (placeholder) path
+        self._letterbox_canvas = None
+        self._letterbox_key = None
+
+        # Kiosks that only use the Alarm/Video pages can opt out of the
+        # camera entirely (no probing, no cv2 import) and run on the
+        # placeholder: pass --no-camera or set SMARTPANEL_NOCAM=1
+        self.camera_disabled = (bool(os.environ.get("SMARTPANEL_NOCAM"))
+                                or "--no-camera" in sys.argv)
+
+        if self.camera_disabled:
+            print("Camera disabled (--no-camera / SMARTPANEL_NOCAM). Using placeholder image.")
+        else:
+            # Probe cameras off the main thread: importing cv2 plus opening
+            # and warming up a camera can block for seconds, so the window
+            # comes up immediately and the feed swaps in when ready
+            threading.Thread(target=self._probe_cameras, daemon=True).start()
+
+        # Warm the (possibly JIT-compiled) drag math off the UI thread so
+        # the first scrollbar drag never pays the compile cost
+        threading.Thread(target=_scroll_to_value, args=(0, 0, 1),
+                         daemon=True).start()
 
         # Layout frames
         self._build_layout()
 
-        # Start loops
+        # Start loops. Video redraws are frame-arrival driven: the capture
+        # thread fires <<NewFrame>> for each stored frame, and a slow fallback
+        # tick keeps the overlays/placeholder fresh when no frames arrive
         self._update_time()
-        self._update_video()
+        self.bind("<<NewFrame>>", self._on_new_frame)
+        self._tick_ui_only()
 
         # Exit handling
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
+    def _tk_font(self, size: int, bold=False):
+        """Return a cached tkinter.font.Font so Tk doesn't re-parse a font
+        tuple on every canvas/widget call (mirrors get_font for PIL fonts)."""
+        key = (size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            font = tkfont.Font(family="Arial", size=size,
+                               weight="bold" if bold else "normal")
+            self._fonts[key] = font
+        return font
+
     # ---------------- Layout ----------------
     def _build_layout(self):
         # Main container - full screen, no padding
@@ -197,11 +285,12 @@ class SmartPanelApp(tk.Tk):
         self.video_frame = tk.Frame(self.main, bg=COLORS["video_bg"], height=420)
         self.video_frame.pack(side="top", fill="both", expand=True, padx=0, pady=0)
 
-        # Use a stacked layout: base label for video, canvas for overlays
-        self.video_label = tk.Label(self.video_frame, bg=COLORS["video_bg"])
-        self.video_label.place(relx=0, rely=0, relwidth=1, relheight=1)
+        # One canvas hosts both the video (a create_image item at the bottom
+        # of the z-order) and the overlay items above it, so Tk invalidates
+        # and composites a single widget per frame instead of two
         self.overlay_canvas = tk.Canvas(self.video_frame, bg=COLORS["video_bg"], highlightthickness=0, bd=0)
         self.overlay_canvas.place(relx=0, rely=0, relwidth=1, relheight=1)
+        self._video_item = self.overlay_canvas.create_image(0, 0, anchor="nw")
         
         # Bind mouse events for interactive controls
         self.overlay_canvas.bind("<Button-1>", self._on_canvas_click)
@@ -217,7 +306,7 @@ class SmartPanelApp(tk.Tk):
 
         # Create buttons with individual borders
         btn_style = {
-            "font": ("Arial", 20, "bold"),
+            "font": self._tk_font(20, True),
             "fg": COLORS["text"],
             "bg": COLORS["button_bg"],
             "activebackground": COLORS["button_hover"],
@@ -259,14 +348,19 @@ class SmartPanelApp(tk.Tk):
         self.info_inner = tk.Frame(self.info_card, bg=COLORS["panel_bg"])
         self.info_inner.pack(padx=24, pady=12)
 
-        self.date_label = tk.Label(self.info_inner, text="--/--/----", font=("Arial", 20, "bold"),
+        # StringVar-backed so _update_time can skip Tk when text is unchanged
+        self._date_var = tk.StringVar(value="--/--/----")
+        self._time_var = tk.StringVar(value="--:--")
+        self._temp_var = tk.StringVar(value="--.-°C")
+
+        self.date_label = tk.Label(self.info_inner, textvariable=self._date_var, font=self._tk_font(20, True),
                                    fg=COLORS["text_dark"], bg=COLORS["panel_bg"])
-        
+
         # Time and temp on same line
         self.time_temp_frame = tk.Frame(self.info_inner, bg=COLORS["panel_bg"])
-        self.time_label = tk.Label(self.time_temp_frame, text="--:--", font=("Arial", 20, "bold"),
+        self.time_label = tk.Label(self.time_temp_frame, textvariable=self._time_var, font=self._tk_font(20, True),
                                    fg=COLORS["text_dark"], bg=COLORS["panel_bg"])
-        self.temp_label = tk.Label(self.time_temp_frame, text="--.-°C", font=("Arial", 20, "bold"),
+        self.temp_label = tk.Label(self.time_temp_frame, textvariable=self._temp_var, font=self._tk_font(20, True),
                                    fg=COLORS["text_dark"], bg=COLORS["panel_bg"])
 
         self.date_label.pack(anchor="center", pady=(0, 2))
@@ -279,214 +373,275 @@ class SmartPanelApp(tk.Tk):
 
     # ---------------- Overlays ----------------
     def _draw_overlay(self, img_w, img_h):
-        """Draw page-specific overlay on the transparent canvas."""
-        self.overlay_canvas.delete("all")
-        
+        """Build or refresh the page-specific overlay on the transparent canvas.
+
+        The static chrome (panels, buttons, icons, scrub bar...) is created
+        once per (page, size) combination; per-frame calls only touch the few
+        dynamic items via coords/itemconfigure so the steady-state cost is a
+        handful of Tcl round-trips instead of ~40 create_* calls.
+        """
         # Store canvas dimensions for click detection
         self.canvas_w = img_w
         self.canvas_h = img_h
 
+        built_key = (self.current_page, img_w, img_h)
+        if built_key != self._overlay_built_for:
+            # Page switch or resize: rebuild the static items from scratch.
+            # The video image item is recreated first so it stays at the
+            # bottom of the z-order under the fresh overlay items.
+            self.overlay_canvas.delete("all")
+            self._video_item = self.overlay_canvas.create_image(0, 0, anchor="nw")
+            if self._video_photo is not None:
+                self.overlay_canvas.itemconfigure(self._video_item, image=self._video_photo)
+            self._dyn_ids = {}
+            self._hit_targets = []
+            if self.current_page == "camera":
+                self._build_camera_overlay(img_w, img_h)
+            elif self.current_page == "video":
+                self._build_video_overlay(img_w, img_h)
+            elif self.current_page == "alarm":
+                self._build_alarm_overlay(img_w, img_h)
+            # Index the registered bounds into the 64px bucket grid so a
+            # click only tests the rects overlapping its cell
+            self._hit_grid = {}
+            for idx, (x1, y1, x2, y2, _cb) in enumerate(self._hit_targets):
+                for cx in range(x1 >> 6, (x2 >> 6) + 1):
+                    for cy in range(y1 >> 6, (y2 >> 6) + 1):
+                        self._hit_grid.setdefault((cx, cy), []).append(idx)
+            self._overlay_built_for = built_key
+
+        self._refresh_page_overlay()
+
+    def _refresh_page_overlay(self):
+        """Refresh the dynamic overlay items of the current page."""
         if self.current_page == "camera":
-            self._draw_camera_overlay(img_w, img_h)
+            self._refresh_camera_overlay()
         elif self.current_page == "video":
-            self._draw_video_overlay(img_w, img_h)
+            self._refresh_video_overlay()
         elif self.current_page == "alarm":
-            self._draw_alarm_overlay(img_w, img_h)
+            self._refresh_alarm_overlay()
 
-    def _draw_camera_overlay(self, w, h):
-        # Show set time at top right if alarm is set
-        if self.alarm_set_time is not None:
-            self.overlay_canvas.create_text(w-30, 30, text=f"Alarm: {self.alarm_set_time}", 
-                                          fill=COLORS["text"], font=("Arial", 20, "bold"), anchor="e")
-        
-        # Draw scrollbars - use consistent positioning
+    def _build_alarm_status(self, w):
+        """Create the top-right 'Alarm: HH:MM' text (blank until an alarm is set)."""
+        self._dyn_ids["alarm_status"] = self.overlay_canvas.create_text(
+            w-30, 30, text="", fill=COLORS["text"], font=self._tk_font(20, True), anchor="e")
+        self._alarm_status_drawn = ""
+
+    def _refresh_alarm_status(self):
+        text = f"Alarm: {self.alarm_set_time}" if self.alarm_set_time is not None else ""
+        if text == self._alarm_status_drawn:
+            return
+        self._alarm_status_drawn = text
+        self.overlay_canvas.itemconfigure(self._dyn_ids["alarm_status"], text=text)
+
+    def _build_camera_overlay(self, w, h):
+        self._build_alarm_status(w)
+
+        # Scrollbars - use consistent positioning
         scroll_top = int(h*0.25)
         scroll_bottom = int(h*0.90)
-        self._draw_scrollbars(w, h, scroll_top, scroll_bottom)
+        self._build_scrollbars(w, h, scroll_top, scroll_bottom)
+
+        # REC indicator - hidden unless recording
+        self._dyn_ids["rec_text"] = self.overlay_canvas.create_text(
+            130, 80, text="REC", fill=COLORS["text"], font=self._tk_font(28, True),
+            anchor="w", state="hidden")
+        self._dyn_ids["rec_dot"] = self.overlay_canvas.create_oval(
+            80, 60, 110, 90, fill=COLORS["accent"], width=0, state="hidden")
 
-        # REC indicator - only show when recording
-        if self.is_recording:
-            self.overlay_canvas.create_text(130, 80, text="REC", fill=COLORS["text"], font=("Arial", 28, "bold"), anchor="w")
-            self.overlay_canvas.create_oval(80, 60, 110, 90, fill=COLORS["accent"], width=0)
-        
         # Camera/Record button in the center bottom
         btn_w = 140
         btn_h = 50
         btn_x = w // 2 - btn_w // 2
         btn_y = int(h * 0.88)
-        
-        # Store button bounds for click detection
-        self.camera_button_bounds = (btn_x, btn_y, btn_x + btn_w, btn_y + btn_h)
-        
-        # Button appearance based on recording state
+
+        # Register button bounds for click dispatch
+        self._hit_targets.append(
+            (btn_x, btn_y, btn_x + btn_w, btn_y + btn_h, self._toggle_recording))
+
+        # Button background (fill/text swap with recording state on refresh)
+        self._dyn_ids["record_btn_rect"] = self.overlay_canvas.create_rectangle(
+            btn_x, btn_y, btn_x + btn_w, btn_y + btn_h,
+            fill="#34C759", outline="", width=0, tags="camera_button")
+        # Button text
+        self._dyn_ids["record_btn_text"] = self.overlay_canvas.create_text(
+            btn_x + btn_w // 2, btn_y + btn_h // 2, text="⏺ Record",
+            fill="#FFFFFF", font=self._tk_font(20, True), tags="camera_button")
+
+    def _refresh_camera_overlay(self):
+        self._refresh_alarm_status()
+        self._refresh_scrollbars()
+
+        # REC indicator + button appearance track the recording state
+        rec_state = "normal" if self.is_recording else "hidden"
+        self.overlay_canvas.itemconfigure(self._dyn_ids["rec_text"], state=rec_state)
+        self.overlay_canvas.itemconfigure(self._dyn_ids["rec_dot"], state=rec_state)
+
         if self.is_recording:
-            btn_color = COLORS["accent"]
-            btn_text = "⏹ Stop"
+            btn_color, btn_text = COLORS["accent"], "⏹ Stop"
         else:
-            btn_color = "#34C759"
-            btn_text = "⏺ Record"
-        
-        # Button background
-        self.overlay_canvas.create_rectangle(btn_x, btn_y, btn_x + btn_w, btn_y + btn_h,
-                                            fill=btn_color, outline="", width=0, tags="camera_button")
-        # Button text
-        self.overlay_canvas.create_text(btn_x + btn_w // 2, btn_y + btn_h // 2, text=btn_text,
-                                       fill="#FFFFFF", font=("Arial", 20, "bold"), tags="camera_button")
-
-    def _draw_video_overlay(self, w, h):
-        # Show set time at top right if alarm is set
-        if self.alarm_set_time is not None:
-            self.overlay_canvas.create_text(w-30, 30, text=f"Alarm: {self.alarm_set_time}", 
-                                          fill=COLORS["text"], font=("Arial", 20, "bold"), anchor="e")
-        
-        # Title (top-left)
-        now = dt.datetime.now()
-        date_str = now.strftime("%d/%m/%Y")
-        self.overlay_canvas.create_text(30, 30, text=f"VIDEO : {date_str}", fill=COLORS["text"],
-                                        font=("Arial", 28, "bold"), anchor="w")
-        
-        # Draw scrollbars - same as camera page
+            btn_color, btn_text = "#34C759", "⏺ Record"
+        self.overlay_canvas.itemconfigure(self._dyn_ids["record_btn_rect"], fill=btn_color)
+        self.overlay_canvas.itemconfigure(self._dyn_ids["record_btn_text"], text=btn_text)
+
+    def _build_video_overlay(self, w, h):
+        self._build_alarm_status(w)
+
+        # Title (top-left); the date text is filled in on refresh
+        self._dyn_ids["video_title"] = self.overlay_canvas.create_text(
+            30, 30, text="", fill=COLORS["text"], font=self._tk_font(28, True), anchor="w")
+        self._video_title_drawn = ""
+
+        # Scrollbars - same as camera page
         scroll_top = int(h*0.25)
         scroll_bottom = int(h*0.90)
-        self._draw_scrollbars(w, h, scroll_top, scroll_bottom)
+        self._build_scrollbars(w, h, scroll_top, scroll_bottom)
 
         # Playback controls & scrub bar
         bar_y = int(h*0.88)
         margin = 150
         self.overlay_canvas.create_line(margin, bar_y, w - margin, bar_y, fill="#FFFFFF", width=4)
         # current time and total time
-        self.overlay_canvas.create_text(margin-35, bar_y, text="6:15", fill="#FFFFFF", font=("Arial", 16), anchor="e")
-        self.overlay_canvas.create_text(w - margin + 35, bar_y, text="8:34", fill="#FFFFFF", font=("Arial", 16), anchor="w")
+        self.overlay_canvas.create_text(margin-35, bar_y, text="6:15", fill="#FFFFFF", font=self._tk_font(16), anchor="e")
+        self.overlay_canvas.create_text(w - margin + 35, bar_y, text="8:34", fill="#FFFFFF", font=self._tk_font(16), anchor="w")
 
         # scrubber circle (somewhere ~70%)
         scrub_x = margin + 0.7*(w - 2*margin)
         self.overlay_canvas.create_oval(scrub_x-10, bar_y-10, scrub_x+10, bar_y+10, fill="#FFFFFF", width=0)
 
-        # playback icons (<<  ►  ||)
+        # playback icons (<<  >  ||)
         icons_y = bar_y - 50
         icons_x = [margin, margin+60, margin+120]
-        icons = ["\u23EA", "\u25B6", "\u23F8"]
+        icons = ["⏪", "▶", "⏸"]
         for i, x in enumerate(icons_x):
-            self.overlay_canvas.create_text(x, icons_y, text=icons[i], fill="#FFFFFF", font=("Arial", 32))
+            self.overlay_canvas.create_text(x, icons_y, text=icons[i], fill="#FFFFFF", font=self._tk_font(32))
+
+    def _refresh_video_overlay(self):
+        self._refresh_alarm_status()
+        self._refresh_scrollbars()
+
+        title = f"VIDEO : {self._date_str}"
+        if title != self._video_title_drawn:
+            self._video_title_drawn = title
+            self.overlay_canvas.itemconfigure(self._dyn_ids["video_title"], text=title)
+
+    def _build_alarm_overlay(self, w, h):
+        self._build_alarm_status(w)
 
-    def _draw_alarm_overlay(self, w, h):
-        # Show set time at top right if alarm is set
-        if self.alarm_set_time is not None:
-            self.overlay_canvas.create_text(w-30, 30, text=f"Alarm: {self.alarm_set_time}", 
-                                          fill=COLORS["text"], font=("Arial", 20, "bold"), anchor="e")
-        
         # Title (top-left)
-        self.overlay_canvas.create_text(30, 30, text="ALARM", fill=COLORS["text"], font=("Arial", 28, "bold"), anchor="w")
-        
+        self.overlay_canvas.create_text(30, 30, text="ALARM", fill=COLORS["text"], font=self._tk_font(28, True), anchor="w")
+
         # Panel dimensions (no dark background rectangle)
         pad = 80
         panel_h = int(h*0.55)
         panel_top = int(h*0.25)
         panel_bottom = panel_top + panel_h
 
-        # Draw scrollbars - same as camera page
+        # Scrollbars - same as camera page
         scroll_top = int(h*0.25)
         scroll_bottom = int(h*0.90)
-        self._draw_scrollbars(w, h, scroll_top, scroll_bottom)
+        self._build_scrollbars(w, h, scroll_top, scroll_bottom)
 
         # Two spinbox control pads (left/right) - more centered
         spinbox_w = 320
         spinbox_h = 180
-        
+
         # Calculate center positions
         center_x = w // 2
         spacing = 100  # Space between spinboxes
-        
+
         left_x1 = center_x - spinbox_w - spacing // 2
         left_y1 = panel_top + 90
         left_x2 = left_x1 + spinbox_w
         left_y2 = left_y1 + spinbox_h
-        
+
         right_x1 = center_x + spacing // 2
         right_y1 = left_y1
         right_x2 = right_x1 + spinbox_w
         right_y2 = left_y2
-        
-        # Store spinbox positions
-        self.spinbox_left = (left_x1, left_y1, left_x2, left_y2)
-        self.spinbox_right = (right_x1, right_y1, right_x2, right_y2)
 
         for idx, (x1, y1, x2, y2) in enumerate([(left_x1, left_y1, left_x2, left_y2), (right_x1, right_y1, right_x2, right_y2)]):
             # Main spinbox background
             self.overlay_canvas.create_rectangle(x1, y1, x2, y2, fill=COLORS["overlay_light"], outline="", width=0)
             # Outer border
             self.overlay_canvas.create_rectangle(x1, y1, x2, y2, outline="#D0D0D0", width=2)
-            
+
             # Display area (larger central area)
             display_x2 = x2 - 60
             self.overlay_canvas.create_rectangle(x1+2, y1+2, display_x2-2, y2-2, fill="#FFFFFF", outline="", width=0)
-            
-            # Center display value with better styling
+
+            # Center display value; the 2-digit text is the only dynamic part
             center_x = (x1 + display_x2) // 2
             center_y = (y1 + y2) // 2
             value = self.alarm_left_value if idx == 0 else self.alarm_right_value
-            # Format as 2-digit time
-            display_text = f"{value:02d}"
-            # Main text
-            self.overlay_canvas.create_text(center_x, center_y, text=display_text, 
-                                          fill=COLORS["text_dark"], font=("Arial", 60, "bold"))
-            
+            digits = _HOUR_STRS if idx == 0 else _MIN_STRS
+            text_key = "alarm_left_text" if idx == 0 else "alarm_right_text"
+            self._dyn_ids[text_key] = self.overlay_canvas.create_text(
+                center_x, center_y, text=digits[value],
+                fill=COLORS["text_dark"], font=self._tk_font(60, True))
+
             # Button area on the right with gradient
             btn_x1 = display_x2
             btn_width = 60
             btn_height = (y2 - y1) // 2
-            
+
             # Up button - with hover effect color
             up_btn_y2 = y1 + btn_height
             tag = f"spinbox_{idx}_up"
-            self.overlay_canvas.create_rectangle(btn_x1, y1+2, x2-2, up_btn_y2-1, 
+            self.overlay_canvas.create_rectangle(btn_x1, y1+2, x2-2, up_btn_y2-1,
                                                 fill="#F0F0F0", outline="", width=0, tags=tag)
             tri_cx = btn_x1 + btn_width // 2
             tri_cy = y1 + btn_height // 2
             self._draw_triangle(tri_cx, tri_cy, 15, direction="up", fill=COLORS["text_dark"])
-            
+
             # Separator line
             self.overlay_canvas.create_line(btn_x1, up_btn_y2, x2, up_btn_y2, fill="#D0D0D0", width=2)
-            
+
             # Down button - with hover effect color
             tag = f"spinbox_{idx}_down"
-            self.overlay_canvas.create_rectangle(btn_x1, up_btn_y2+1, x2-2, y2-2, 
+            self.overlay_canvas.create_rectangle(btn_x1, up_btn_y2+1, x2-2, y2-2,
                                                 fill="#F0F0F0", outline="", width=0, tags=tag)
             tri_cy = up_btn_y2 + btn_height // 2
             self._draw_triangle(tri_cx, tri_cy, 15, direction="down", fill=COLORS["text_dark"])
 
+            # Register the up/down button regions for click dispatch
+            step = self._spin_hour if idx == 0 else self._spin_minute
+            self._hit_targets.append((btn_x1, y1, x2, up_btn_y2, lambda s=step: s(+1)))
+            self._hit_targets.append((btn_x1, up_btn_y2, x2, y2, lambda s=step: s(-1)))
+
         # Labels under spinboxes
         left_center_x = (left_x1 + left_x2) // 2
         right_center_x = (right_x1 + right_x2) // 2
         label_y = left_y2 + 30
-        self.overlay_canvas.create_text(left_center_x, label_y, text="HOUR", fill="#A0A0A0", font=("Arial", 16, "bold"))
-        self.overlay_canvas.create_text(right_center_x, label_y, text="MINUTE", fill="#A0A0A0", font=("Arial", 16, "bold"))
-        
+        self.overlay_canvas.create_text(left_center_x, label_y, text="HOUR", fill="#A0A0A0", font=self._tk_font(16, True))
+        self.overlay_canvas.create_text(right_center_x, label_y, text="MINUTE", fill="#A0A0A0", font=self._tk_font(16, True))
+
         # Two circular indicators in the middle (colon separator) - white circles
         mid_x = w // 2
         cy = (left_y1 + left_y2) // 2
         dot_spacing = 15
         for cy_offset in [-dot_spacing, dot_spacing]:
-            self.overlay_canvas.create_oval(mid_x-8, cy+cy_offset-8, mid_x+8, cy+cy_offset+8, 
+            self.overlay_canvas.create_oval(mid_x-8, cy+cy_offset-8, mid_x+8, cy+cy_offset+8,
                                           outline=COLORS["text"], fill=COLORS["text"], width=0)
-        
+
         # Done button at the bottom right of the panel
         btn_w = 140
         btn_h = 50
         btn_x = w - pad - btn_w + 20
         btn_y = panel_bottom + 80
-        
-        # Store button bounds for click detection
-        self.alarm_done_button = (btn_x, btn_y, btn_x + btn_w, btn_y + btn_h)
-        
+
+        # Register button bounds for click dispatch
+        self._hit_targets.append(
+            (btn_x, btn_y, btn_x + btn_w, btn_y + btn_h, self._confirm_alarm))
+
         # Button shadow
         shadow_offset = 4
         self.overlay_canvas.create_rectangle(
-            btn_x + shadow_offset, btn_y + shadow_offset, 
+            btn_x + shadow_offset, btn_y + shadow_offset,
             btn_x + btn_w + shadow_offset, btn_y + btn_h + shadow_offset,
             fill="#00000030", outline="", width=0
         )
-        
+
         # Button background - iOS style blue
         self.overlay_canvas.create_rectangle(btn_x, btn_y, btn_x + btn_w, btn_y + btn_h,
                                             fill=COLORS["accent_blue"], outline="", width=0, tags="done_button")
@@ -495,7 +650,24 @@ class SmartPanelApp(tk.Tk):
                                             outline="#CCCCCC", width=1, tags="done_button")
         # Button text
         self.overlay_canvas.create_text(btn_x + btn_w // 2, btn_y + btn_h // 2, text="✓ Done",
-                                       fill="#FFFFFF", font=("Arial", 22, "bold"), tags="done_button")
+                                       fill="#FFFFFF", font=self._tk_font(22, True), tags="done_button")
+
+        # Digit texts were created at the current values above
+        self._alarm_drawn = (self.alarm_left_value, self.alarm_right_value)
+
+    def _refresh_alarm_overlay(self):
+        self._refresh_alarm_status()
+        self._refresh_scrollbars()
+
+        # Only touch the digit texts when a spin actually changed them
+        values = (self.alarm_left_value, self.alarm_right_value)
+        if values == self._alarm_drawn:
+            return
+        self._alarm_drawn = values
+        self.overlay_canvas.itemconfigure(self._dyn_ids["alarm_left_text"],
+                                          text=_HOUR_STRS[self.alarm_left_value])
+        self.overlay_canvas.itemconfigure(self._dyn_ids["alarm_right_text"],
+                                          text=_MIN_STRS[self.alarm_right_value])
 
     def _draw_triangle(self, cx, cy, size, direction="up", fill="#FFFFFF"):
         if direction == "up":
@@ -503,102 +675,353 @@ class SmartPanelApp(tk.Tk):
         else:
             points = [cx, cy + size, cx - size*0.8, cy - size*0.8, cx + size*0.8, cy - size*0.8]
         self.overlay_canvas.create_polygon(points, fill=fill, width=0)
-    
-    def _draw_scrollbars(self, w, h, scroll_top, scroll_bottom):
-        """Draw consistent scrollbars on both sides of the screen."""
+
+    def _render_scroll_icons(self):
+        """Rasterize the sun / mute-speaker glyphs once into RGBA sprites so
+        the scrollbar builder places a single image item per icon instead of
+        composing them from text or line/polygon primitives."""
+        if self._sun_icon_tk is not None:
+            return
+        size = 24
+        c = size // 2
+
+        # Sun: filled disc with eight rays
+        img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        draw.ellipse([c-5, c-5, c+5, c+5], fill="#FFFFFF")
+        for i in range(8):
+            ang = i * math.pi / 4
+            draw.line([c + 7*math.cos(ang), c + 7*math.sin(ang),
+                       c + 10*math.cos(ang), c + 10*math.sin(ang)],
+                      fill="#FFFFFF", width=2)
+        self._sun_icon_tk = ImageTk.PhotoImage(img)
+
+        # Mute speaker: box + cone + X, same shapes as the reference mockup
+        img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        draw.rectangle([c-8, c-3, c-5, c+3], fill="#FFFFFF")
+        draw.polygon([(c-5, c-3), (c-5, c+3), (c-1, c+5), (c-1, c-5)], fill="#FFFFFF")
+        draw.line([c+1, c-4, c+5, c+4], fill="#FFFFFF", width=2)
+        draw.line([c+1, c+4, c+5, c-4], fill="#FFFFFF", width=2)
+        self._mute_icon_tk = ImageTk.PhotoImage(img)
+
+    def _build_scrollbars(self, w, h, scroll_top, scroll_bottom):
+        """Create tracks, thumbs and icons for both scrollbars; the thumbs are
+        the only dynamic items and get moved later via canvas.coords."""
+        self._render_scroll_icons()
         scroll_height = scroll_bottom - scroll_top
         thumb_height = 50
-        
+        self._thumb_height = thumb_height
+        # Thumbs are created at the current values below, so the first
+        # refresh can skip too
+        self._scroll_drawn = (self.brightness_value, self.volume_value)
+
         # Left brightness scrollbar
         left_x = 40
         self.left_scroll_x = left_x
         self.left_scroll_top = scroll_top
         self.left_scroll_bottom = scroll_bottom
         self.left_scroll_height = scroll_height
-        
+
+        # Draggable strip (a little wider than the visible track)
+        self._hit_regions["brightness_bar"] = (left_x-20, scroll_top, left_x+20, scroll_bottom)
+
         # Track
-        self.overlay_canvas.create_rectangle(left_x-4, scroll_top, left_x+4, scroll_bottom, 
+        self.overlay_canvas.create_rectangle(left_x-4, scroll_top, left_x+4, scroll_bottom,
                                             fill=COLORS["scrollbar_track"], outline="", width=0)
         # Thumb
         thumb_pos = scroll_top + int((scroll_height - thumb_height) * (1 - self.brightness_value/100))
-        self.overlay_canvas.create_rectangle(left_x-6, thumb_pos, left_x+6, thumb_pos+thumb_height, 
-                                            fill=COLORS["scrollbar_thumb"], outline="", width=0)
+        self._dyn_ids["brightness_thumb"] = self.overlay_canvas.create_rectangle(
+            left_x-6, thumb_pos, left_x+6, thumb_pos+thumb_height,
+            fill=COLORS["scrollbar_thumb"], outline="", width=0)
         # Icon
-        self.overlay_canvas.create_text(left_x, scroll_top-20, text="☼", fill="#FFFFFF", font=("Arial", 18))
-        
+        self.overlay_canvas.create_image(left_x, scroll_top-20, image=self._sun_icon_tk)
+
         # Right volume scrollbar
         right_x = w - 40
         self.right_scroll_x = right_x
         self.right_scroll_top = scroll_top
         self.right_scroll_bottom = scroll_bottom
         self.right_scroll_height = scroll_height
-        
+
+        # Draggable strip (a little wider than the visible track)
+        self._hit_regions["volume_bar"] = (right_x-20, scroll_top, right_x+20, scroll_bottom)
+
         # Track
-        self.overlay_canvas.create_rectangle(right_x-4, scroll_top, right_x+4, scroll_bottom, 
+        self.overlay_canvas.create_rectangle(right_x-4, scroll_top, right_x+4, scroll_bottom,
                                             fill=COLORS["scrollbar_track"], outline="", width=0)
         # Thumb
         thumb_pos = scroll_top + int((scroll_height - thumb_height) * (1 - self.volume_value/100))
-        self.overlay_canvas.create_rectangle(right_x-6, thumb_pos, right_x+6, thumb_pos+thumb_height, 
-                                            fill=COLORS["scrollbar_thumb"], outline="", width=0)
-        # Volume icon - use muted speaker symbol
-        self.overlay_canvas.create_text(right_x, scroll_top-20, text="�", fill="#FFFFFF", font=("Arial", 18))
+        self._dyn_ids["volume_thumb"] = self.overlay_canvas.create_rectangle(
+            right_x-6, thumb_pos, right_x+6, thumb_pos+thumb_height,
+            fill=COLORS["scrollbar_thumb"], outline="", width=0)
+        # Volume icon - muted speaker sprite
+        self.overlay_canvas.create_image(right_x, scroll_top-20, image=self._mute_icon_tk)
+
+    def _refresh_scrollbars(self):
+        """Move the scrollbar thumbs to match the current brightness/volume.
+
+        No-op unless a value actually changed since the last refresh, so the
+        steady state (user not dragging) costs zero Tk traffic.
+        """
+        values = (self.brightness_value, self.volume_value)
+        if values == self._scroll_drawn:
+            return
+        self._scroll_drawn = values
+
+        thumb_height = self._thumb_height
+        thumb_pos = self.left_scroll_top + int(
+            (self.left_scroll_height - thumb_height) * (1 - self.brightness_value/100))
+        self.overlay_canvas.coords(self._dyn_ids["brightness_thumb"],
+                                   self.left_scroll_x-6, thumb_pos,
+                                   self.left_scroll_x+6, thumb_pos+thumb_height)
+        thumb_pos = self.right_scroll_top + int(
+            (self.right_scroll_height - thumb_height) * (1 - self.volume_value/100))
+        self.overlay_canvas.coords(self._dyn_ids["volume_thumb"],
+                                   self.right_scroll_x-6, thumb_pos,
+                                   self.right_scroll_x+6, thumb_pos+thumb_height)
+
+    # ---------------- Camera probing ----------------
+    def _probe_cameras(self):
+        """Try camera indices/backends until one delivers frames (runs on a
+        background thread; on success starts the capture worker)."""
+        if _ensure_cv2() is None:
+            print("⚠ OpenCV not available. Using placeholder image.")
+            return
+
+        # For Mac: try AVFoundation backend first, index 0 is usually built-in, 1 is external
+        camera_configs = [
+            (0, cv2.CAP_AVFOUNDATION),  # Built-in camera with AVFoundation
+            (1, cv2.CAP_AVFOUNDATION),  # External/Continuity camera with AVFoundation
+            (0, cv2.CAP_ANY),           # Built-in camera with default backend
+            (1, cv2.CAP_ANY),           # External camera with default backend
+            (2, cv2.CAP_ANY),           # Third camera option
+        ]
+
+        for cam_index, backend in camera_configs:
+            cap = None
+            try:
+                print(f"Trying to open camera {cam_index} with backend {backend}...")
+                cap = cv2.VideoCapture(cam_index, backend)
+                # Set a reasonable resolution (if supported)
+                if cap is not None and cap.isOpened():
+                    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+                    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+                    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+                    # Ask for MJPEG: the camera compresses on-board and OpenCV
+                    # decodes with libjpeg-turbo (SIMD) instead of converting
+                    # raw YUYV on the CPU; cameras that don't support it just
+                    # keep their default format
+                    mjpg = cv2.VideoWriter_fourcc(*"MJPG")
+                    cap.set(cv2.CAP_PROP_FOURCC, mjpg)
+                    if int(cap.get(cv2.CAP_PROP_FOURCC)) != mjpg:
+                        print(f"  (camera {cam_index} kept its default pixel format)")
+
+                    # Warm up the camera by discarding first few frames
+                    print(f"Warming up camera {cam_index}...")
+                    for i in range(10):
+                        ret, test_frame = cap.read()
+                        time.sleep(0.1)
+
+                    # Test if we can actually read a valid frame
+                    ret, test_frame = cap.read()
+                    if ret and test_frame is not None and test_frame.size > 0:
+                        # Check if frame has actual data (not all black)
+                        mean_value = test_frame.mean()
+                        print(f"✓ Camera {cam_index} opened successfully!")
+                        print(f"  Resolution: {test_frame.shape[1]}x{test_frame.shape[0]}")
+                        print(f"  Frame mean value: {mean_value:.2f} (checking for actual image data)")
+                        if mean_value < 1.0:
+                            print(f"  ⚠ Warning: Camera might be showing black screen (very low brightness)")
+                        with self._frame_lock:
+                            self.cap = cap
+                        self.camera_available = True
+                        break
+                    else:
+                        print(f"✗ Camera {cam_index} opened but no valid frames")
+                        cap.release()
+            except Exception as e:
+                print(f"✗ Camera {cam_index} failed: {e}")
+                if cap is not None:
+                    try:
+                        cap.release()
+                    except:
+                        pass
+
+        if not self.camera_available:
+            print("⚠ No camera available. Using placeholder image.")
+        else:
+            self._start_capture_thread()
 
     # ---------------- Video update ----------------
-    def _update_video(self):
-        frame = None
-        # Only read from camera if recording is active
-        if self.is_recording and self.camera_available and self.cap is not None and self.cap.isOpened():
+    def _start_capture_thread(self):
+        """Launch the daemon thread that feeds the single-slot frame buffer."""
+        if self._capture_thread is not None and self._capture_thread.is_alive():
+            return
+        self._capture_running = True
+        self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._capture_thread.start()
+
+    def _capture_loop(self):
+        """Read frames off the UI thread and keep only the most recent one.
+
+        OpenCV's read() blocks on decode and its backends buffer several
+        frames internally; running it on the Tk main loop stalls redraws and
+        builds up multi-second latency. The single slot means slow redraws
+        simply drop frames instead of queueing them.
+        """
+        grabbed = 0
+        while self._capture_running:
+            if self.cap is None or not self.cap.isOpened():
+                break
+            # Decode every frame only while the Camera page shows the feed;
+            # elsewhere grab() keeps the driver queue drained while skipping
+            # the YUV->BGR decode that retrieve()/read() would pay
+            decode_every = 1 if self.current_page == "camera" else 15
             try:
-                ok, frame = self.cap.read()
-                if not ok or frame is None or frame.size == 0:
+                ok = self.cap.grab()
+                grabbed += 1
+                if ok and grabbed % decode_every == 0:
+                    ok, frame = self.cap.retrieve()
+                else:
                     frame = None
-                    # Camera disconnected, mark as unavailable
-                    if self.camera_available:
-                        self.camera_available = False
-                        print("⚠ Camera feed lost - switching to placeholder")
             except Exception as e:
                 print(f"Error reading camera frame: {e}")
-                frame = None
                 self.camera_available = False
-        
-        if frame is None or not self.is_recording:
-            # Fallback image
-            img = self.placeholder_img.copy()
-        else:
-            # Verify frame has data
-            if frame.size == 0 or frame.shape[0] == 0 or frame.shape[1] == 0:
-                print("⚠ Received empty frame from camera")
-                img = self.placeholder_img.copy()
+                break
+            if not ok:
+                # Camera disconnected, mark as unavailable
+                self.camera_available = False
+                print("⚠ Camera feed lost - switching to placeholder")
+                break
+            if frame is None or frame.size == 0:
+                continue
+            with self._frame_lock:
+                self._latest_frame = frame
+            # Wake the UI for exactly this frame instead of letting it poll
+            try:
+                self.event_generate("<<NewFrame>>", when="tail")
+            except tk.TclError:
+                break  # window being torn down
+
+    def _on_new_frame(self, event=None):
+        self._update_video()
+
+    def _tick_ui_only(self):
+        """Slow fallback refresh (10 Hz) so overlays and the placeholder stay
+        current when the capture thread isn't generating <<NewFrame>>."""
+        self._update_video()
+        self.after(100, self._tick_ui_only)
+
+    def _update_video(self):
+        frame = None
+        # Only show the camera feed while recording is active
+        if self.is_recording and self.camera_available:
+            # Pick up the newest frame without blocking; if the capture
+            # thread hasn't produced a fresh one since last tick, re-show
+            # the previous frame rather than flashing the placeholder
+            with self._frame_lock:
+                frame = self._latest_frame
+                self._latest_frame = None
+            if frame is None:
+                frame = self._shown_frame
             else:
-                # Convert BGR -> RGB
-                try:
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    img = Image.fromarray(frame_rgb)
-                except Exception as e:
-                    print(f"Error converting frame: {e}")
-                    img = self.placeholder_img.copy()
+                self._shown_frame = frame
+
+        showing_placeholder = frame is None or not self.is_recording
+        # Verify frame has data
+        if not showing_placeholder and (frame.size == 0 or frame.shape[0] == 0 or frame.shape[1] == 0):
+            print("⚠ Received empty frame from camera")
+            showing_placeholder = True
 
         # Fit to widget size while preserving aspect
         w = max(self.video_frame.winfo_width(), 100)
         h = max(self.video_frame.winfo_height(), 100)
-        
+
         try:
-            img = self._letterbox(img, (w, h), COLORS["video_bg"])
-            
-            # Update Tk image
-            self.tk_img = ImageTk.PhotoImage(img)
-            self.video_label.configure(image=self.tk_img)
-            
+            if not showing_placeholder:
+                try:
+                    img = self._letterbox_frame(frame, (w, h))
+                except Exception as e:
+                    print(f"Error converting frame: {e}")
+                    showing_placeholder = True
+
+            if showing_placeholder:
+                # Static image: swap in the prebuilt PhotoImage once; no
+                # per-frame copy/letterbox/blit work at all
+                if not self._photo_is_placeholder or self._placeholder_tk_size != (w, h):
+                    self._set_video_image(self._placeholder_photo(w, h))
+                    self._photo_is_placeholder = True
+            else:
+                # Live frame: blit into one persistent PhotoImage, reallocated
+                # only when the widget resizes
+                if self._photo is None or self._photo_size != (w, h):
+                    self._photo = ImageTk.PhotoImage(img)
+                    self._photo_size = (w, h)
+                    self._set_video_image(self._photo)
+                else:
+                    self._photo.paste(img)
+                    if self._photo_is_placeholder:
+                        self._set_video_image(self._photo)
+                self._photo_is_placeholder = False
+
             # Draw overlays after updating the video
             self._draw_overlay(w, h)
         except Exception as e:
             print(f"Error updating video display: {e}")
 
-        # Schedule next frame
-        self.after(33, self._update_video)
+    def _set_video_image(self, photo):
+        """Point the canvas video item at the given PhotoImage."""
+        self._video_photo = photo
+        self.overlay_canvas.itemconfigure(self._video_item, image=photo)
+
+    def _placeholder_photo(self, w, h):
+        """Letterboxed placeholder as a prebuilt PhotoImage, cached per size."""
+        if self._placeholder_tk is None or self._placeholder_tk_size != (w, h):
+            img = self._letterbox(self.placeholder_img, (w, h), COLORS["video_bg"])
+            self._placeholder_tk = ImageTk.PhotoImage(img)
+            self._placeholder_tk_size = (w, h)
+        return self._placeholder_tk
+
+    def _letterbox_frame(self, frame, target_size):
+        """Letterbox a BGR camera frame via cv2 into a preallocated RGB buffer.
+
+        INTER_LINEAR costs a fraction of PIL's LANCZOS at webcam resolutions
+        and the composited result lives in one reusable contiguous array, so
+        the returned PIL image just wraps that memory without copying it.
+        """
+        target_w, target_h = target_size
+        frame_h, frame_w = frame.shape[:2]
+        scale = min(target_w / frame_w, target_h / frame_h)
+        new_w = max(1, int(frame_w * scale))
+        new_h = max(1, int(frame_h * scale))
+
+        if self._frame_canvas is None or self._frame_canvas.shape[:2] != (target_h, target_w):
+            bg = ImageColor.getrgb(COLORS["video_bg"])
+            self._frame_canvas = np.full((target_h, target_w, 3), bg, dtype=np.uint8)
+
+        # Resize and BGR->RGB write into preallocated contiguous scratch
+        # buffers (cv2 dst= arguments), so the only per-frame memory traffic
+        # is the final composite into the canvas slice - no allocations
+        if self._resize_buf is None or self._resize_buf.shape[:2] != (new_h, new_w):
+            self._resize_buf = np.empty((new_h, new_w, 3), dtype=np.uint8)
+            self._rgb_buf = np.empty_like(self._resize_buf)
+        cv2.resize(frame, (new_w, new_h), dst=self._resize_buf, interpolation=cv2.INTER_LINEAR)
+        cv2.cvtColor(self._resize_buf, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+
+        x = (target_w - new_w) // 2
+        y = (target_h - new_h) // 2
+        self._frame_canvas[y:y+new_h, x:x+new_w] = self._rgb_buf
+        return Image.frombuffer("RGB", (target_w, target_h), self._frame_canvas, "raw", "RGB", 0, 1)
 
     def _letterbox(self, img: Image.Image, target_size, bg_color):
-        """Resize with aspect ratio preserved, pad with bg_color."""
+        """Resize with aspect ratio preserved, pad with bg_color.
+
+        The padded canvas is a single reused allocation (fresh only when the
+        target size or background changes); callers must consume the returned
+        image before the next _letterbox call.
+        """
         target_w, target_h = target_size
         img_w, img_h = img.size
         scale = min(target_w / img_w, target_h / img_h)
@@ -606,7 +1029,12 @@ class SmartPanelApp(tk.Tk):
         new_h = max(1, int(img_h * scale))
         img_resized = img.resize((new_w, new_h), Image.LANCZOS)
 
-        canvas = Image.new("RGB", (target_w, target_h), bg_color)
+        key = (target_w, target_h, bg_color)
+        if self._letterbox_key != key:
+            self._letterbox_key = key
+            self._letterbox_canvas = Image.new("RGB", (target_w, target_h), bg_color)
+        canvas = self._letterbox_canvas
+        canvas.paste(bg_color, (0, 0, target_w, target_h))
         offset = ((target_w - new_w) // 2, (target_h - new_h) // 2)
         canvas.paste(img_resized, offset)
         return canvas
@@ -614,12 +1042,20 @@ class SmartPanelApp(tk.Tk):
     def _make_placeholder(self):
         """Generate a neutral placeholder image that simulates a defocused camera."""
         w, h = 960, 540
-        img = Image.new("RGB", (w, h), COLORS["video_bg"])
-        draw = ImageDraw.Draw(img)
-        # Add a soft gradient / vignette
-        for i in range(16):
-            alpha = int(180 * (i/15))
-            draw.rectangle([i*5, i*5, w - i*5, h - i*5], outline=(23, 23, 23))
+        if np is not None:
+            # Soft radial vignette computed in one vectorized pass
+            bg = np.array(ImageColor.getrgb(COLORS["video_bg"]), dtype=np.float32)
+            y = np.arange(h, dtype=np.float32)[:, None]
+            x = np.arange(w, dtype=np.float32)[None, :]
+            vign = 1.0 - (((x - w/2)**2 + (y - h/2)**2) / ((w/2)**2 + (h/2)**2))
+            img = Image.fromarray((bg * vign[..., None]).astype(np.uint8))
+            draw = ImageDraw.Draw(img)
+        else:
+            img = Image.new("RGB", (w, h), COLORS["video_bg"])
+            draw = ImageDraw.Draw(img)
+            # Add a soft gradient / vignette
+            for i in range(16):
+                draw.rectangle([i*5, i*5, w - i*5, h - i*5], outline=(23, 23, 23))
         # Text
         txt = "Webcam Unavailable\n(Showing placeholder)"
         font = get_font(20, True)
@@ -629,13 +1065,21 @@ class SmartPanelApp(tk.Tk):
         return img
 
     # ---------------- Time/Temp update ----------------
+    @staticmethod
+    def _set_if_changed(var, text):
+        """Set a StringVar only when the text differs, skipping the Tk
+        relayout that every write would otherwise trigger."""
+        if var.get() != text:
+            var.set(text)
+
     def _update_time(self):
         now = dt.datetime.now()
-        self.date_label.configure(text=now.strftime("%m/%d/%Y"))
-        self.time_label.configure(text=now.strftime("%H:%M"))
+        self._date_str = now.strftime("%d/%m/%Y")
+        self._set_if_changed(self._date_var, now.strftime("%m/%d/%Y"))
+        self._set_if_changed(self._time_var, now.strftime("%H:%M"))
         # Simulate temp gently oscillating
         self.temp_c = 20.0 + 0.8 * (time.time() % 60) / 60.0
-        self.temp_label.configure(text=f"{self.temp_c:0.1f}°C")
+        self._set_if_changed(self._temp_var, f"{self.temp_c:0.1f}°C")
         self.after(1000, self._update_time)
 
     # ---------------- Page switching ----------------
@@ -671,90 +1115,86 @@ class SmartPanelApp(tk.Tk):
 
     # ---------------- Event handlers ----------------
     def _on_canvas_click(self, event):
-        """Handle mouse clicks on the canvas."""
+        """Handle mouse clicks on the canvas.
+
+        The overlay builders register every clickable region for the current
+        page in self._hit_targets; the bucket grid built alongside it narrows
+        each click to the rects overlapping its 64px cell.
+        """
         x, y = event.x, event.y
-        
-        # Check camera record button (on Camera page)
-        if self.current_page == "camera" and hasattr(self, 'camera_button_bounds'):
-            x1, y1, x2, y2 = self.camera_button_bounds
+        for idx in self._hit_grid.get((x >> 6, y >> 6), ()):
+            x1, y1, x2, y2, callback = self._hit_targets[idx]
             if x1 <= x <= x2 and y1 <= y <= y2:
-                self.is_recording = not self.is_recording
-                if self.is_recording:
-                    print("🔴 Recording started")
-                else:
-                    print("⏹ Recording stopped")
+                callback()
+                # Reflect the press immediately instead of waiting for the
+                # next frame/UI tick
+                self._refresh_page_overlay()
                 return
-        
-        if self.current_page == "alarm":
-            # Check Done button
-            if hasattr(self, 'alarm_done_button'):
-                x1, y1, x2, y2 = self.alarm_done_button
-                if x1 <= x <= x2 and y1 <= y <= y2:
-                    # Set the alarm time
-                    self.alarm_set_time = f"{self.alarm_left_value:02d}:{self.alarm_right_value:02d}"
-                    print(f"✓ Alarm set to {self.alarm_set_time}")
-                    return
-            
-            # Check spinbox buttons
-            if hasattr(self, 'spinbox_left'):
-                x1, y1, x2, y2 = self.spinbox_left
-                btn_x1 = x2 - 50
-                btn_height = (y2 - y1) // 2
-                
-                # Left spinbox up button (Hours: 0-23)
-                if btn_x1 <= x <= x2 and y1 <= y <= y1 + btn_height:
-                    self.alarm_left_value = (self.alarm_left_value + 1) % 24
-                    print(f"Hour: {self.alarm_left_value:02d}")
-                    return
-                # Left spinbox down button
-                elif btn_x1 <= x <= x2 and y1 + btn_height <= y <= y2:
-                    self.alarm_left_value = (self.alarm_left_value - 1) % 24
-                    print(f"Hour: {self.alarm_left_value:02d}")
-                    return
-            
-            if hasattr(self, 'spinbox_right'):
-                x1, y1, x2, y2 = self.spinbox_right
-                btn_x1 = x2 - 50
-                btn_height = (y2 - y1) // 2
-                
-                # Right spinbox up button (Minutes: 0-59)
-                if btn_x1 <= x <= x2 and y1 <= y <= y1 + btn_height:
-                    self.alarm_right_value = (self.alarm_right_value + 1) % 60
-                    print(f"Minute: {self.alarm_right_value:02d}")
-                    return
-                # Right spinbox down button
-                elif btn_x1 <= x <= x2 and y1 + btn_height <= y <= y2:
-                    self.alarm_right_value = (self.alarm_right_value - 1) % 60
-                    print(f"Minute: {self.alarm_right_value:02d}")
-                    return
-    
+
+    def _toggle_recording(self):
+        self.is_recording = not self.is_recording
+        log.debug("Recording %s", "started" if self.is_recording else "stopped")
+
+    def _confirm_alarm(self):
+        self.alarm_set_time = _TIME_STRS[self.alarm_left_value * 60 + self.alarm_right_value]
+        log.debug("Alarm set to %s", self.alarm_set_time)
+
+    def _spin_hour(self, delta):
+        self.alarm_left_value = (self.alarm_left_value + delta) % 24
+        log.debug("Hour: %02d", self.alarm_left_value)
+
+    def _spin_minute(self, delta):
+        self.alarm_right_value = (self.alarm_right_value + delta) % 60
+        log.debug("Minute: %02d", self.alarm_right_value)
+
     def _on_canvas_drag(self, event):
-        """Handle mouse dragging on scrollbars."""
-        x, y = event.x, event.y
-        
+        """Handle mouse dragging on scrollbars.
+
+        <B1-Motion> fires far faster than the canvas repaints, so the handler
+        only records the newest coordinate and schedules one _flush_drag per
+        idle cycle; intermediate positions are coalesced away.
+        """
+        self._pending_drag = (event.x, event.y)
+        if not self._drag_scheduled:
+            self._drag_scheduled = True
+            self.after_idle(self._flush_drag)
+
+    def _flush_drag(self):
+        """Apply the most recent drag coordinate to the scrollbar values."""
+        self._drag_scheduled = False
+        if self._pending_drag is None:
+            return
+        x, y = self._pending_drag
+        self._pending_drag = None
+
         # Check if dragging on left scrollbar
-        if hasattr(self, 'left_scroll_x') and hasattr(self, 'left_scroll_top'):
-            if abs(x - self.left_scroll_x) < 20:
-                if self.left_scroll_top <= y <= self.left_scroll_bottom:
-                    # Update brightness based on y position (inverted - top = 100%, bottom = 0%)
-                    progress = (y - self.left_scroll_top) / self.left_scroll_height
-                    self.brightness_value = max(0, min(100, int((1 - progress) * 100)))
-                    print(f"Brightness: {self.brightness_value}%")
-                    return
-        
+        region = self._hit_regions.get("brightness_bar")
+        if region is not None:
+            x1, y1, x2, y2 = region
+            if x1 <= x <= x2 and y1 <= y <= y2:
+                # Inverted: top = 100%, bottom = 0%
+                self.brightness_value = _scroll_to_value(y, y1, self.left_scroll_height)
+                # Move the thumb now rather than on the next video tick
+                self._refresh_scrollbars()
+                return
+
         # Check if dragging on right scrollbar
-        if hasattr(self, 'right_scroll_x') and hasattr(self, 'right_scroll_top'):
-            if abs(x - self.right_scroll_x) < 20:
-                if self.right_scroll_top <= y <= self.right_scroll_bottom:
-                    # Update volume based on y position (inverted - top = 100%, bottom = 0%)
-                    progress = (y - self.right_scroll_top) / self.right_scroll_height
-                    self.volume_value = max(0, min(100, int((1 - progress) * 100)))
-                    print(f"Volume: {self.volume_value}%")
-                    return
+        region = self._hit_regions.get("volume_bar")
+        if region is not None:
+            x1, y1, x2, y2 = region
+            if x1 <= x <= x2 and y1 <= y <= y2:
+                # Inverted: top = 100%, bottom = 0%
+                self.volume_value = _scroll_to_value(y, y1, self.right_scroll_height)
+                # Move the thumb now rather than on the next video tick
+                self._refresh_scrollbars()
+                return
 
     # ---------------- Cleanup ----------------
     def _on_close(self):
         try:
+            self._capture_running = False
+            if self._capture_thread is not None and self._capture_thread.is_alive():
+                self._capture_thread.join(timeout=1.0)
             if self.cap is not None:
                 self.cap.release()
             if cv2 is not None:
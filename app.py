@@ -3,92 +3,295 @@ Smart Panel Web Application
 Flask backend with camera streaming support
 """
 
+# eventlet's cooperative workers let SocketIO emits interleave with the
+# long-lived MJPEG stream generators instead of each holding a thread.
+# monkey_patch must run before anything else imports the stdlib modules
+# it patches; falls back to the threading backend when not installed.
+try:
+    import eventlet
+    eventlet.monkey_patch()
+    _async_mode = 'eventlet'
+except ImportError:
+    eventlet = None
+    _async_mode = 'threading'
+
 from flask import Flask, render_template, Response, jsonify, request
-from flask_socketio import SocketIO
+from flask_socketio import SocketIO, join_room
 import cv2
+import numpy as np
 import datetime
 import time
 import threading
+from dataclasses import dataclass, fields, asdict
+
+# The camera workers sit in long blocking C calls (VideoCapture open,
+# grab/retrieve, imencode) with no cooperative yield. Under the monkey
+# patch threading.Thread spawns greenlets, which would pin the eventlet
+# hub and wedge the whole server, so those workers always get real OS
+# threads - and the locks they share must be the unpatched primitives,
+# since green locks aren't safe to touch from a foreign OS thread.
+if eventlet is not None:
+    from eventlet import tpool
+    _threading = eventlet.patcher.original('threading')
+else:
+    tpool = None
+    _threading = threading
+_Thread = _threading.Thread
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'smart-panel-secret-key'
-socketio = SocketIO(app, cors_allowed_origins="*")
-
-# Global state
-state = {
-    'current_page': 'camera',
-    'is_recording': False,
-    'brightness': 50,
-    'volume': 50,
-    'alarm_hour': datetime.datetime.now().hour,
-    'alarm_minute': datetime.datetime.now().minute,
-    'alarm_set_time': None,
-    'temperature': 20.0
-}
-
-# Camera setup
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=_async_mode)
+
+# Optional: PyTurboJPEG wraps libjpeg-turbo's SIMD encoder and returns bytes
+# directly, skipping cv2.imencode's numpy buffer + tobytes() copy. Falls back
+# to OpenCV when the library isn't installed.
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    _turbo = TurboJPEG()
+except Exception:
+    _turbo = None
+
+# Optional: orjson is a C JSON encoder that returns bytes directly. Routing
+# Flask's JSON through it speeds up every jsonify()/request.json call; the
+# default provider stays in place when it isn't installed.
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+
+    class ORJSONProvider(DefaultJSONProvider):
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+except ImportError:
+    orjson = None
+
+# Encoder params are built once rather than per frame
+_JPEG_QUALITY = 85
+_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, _JPEG_QUALITY]
+
+# Let OpenCV's T-API use OpenCL where it has kernels (harmless without a
+# device). JPEG encode is NOT one of them, so frames are deliberately not
+# wrapped in UMat before imencode - that would only add a host->device->
+# host round-trip per frame before encoding on the CPU anyway.
+try:
+    if cv2.ocl.haveOpenCL():
+        cv2.ocl.setUseOpenCL(True)
+except Exception:
+    pass
+
+def encode_jpeg(frame, quality=_JPEG_QUALITY):
+    """Encode a BGR frame to JPEG bytes with the fastest available encoder."""
+    if _turbo is not None:
+        return _turbo.encode(frame, quality=quality, pixel_format=TJPF_BGR)
+    params = _JPEG_PARAMS if quality == _JPEG_QUALITY else \
+        [cv2.IMWRITE_JPEG_QUALITY, quality]
+    ret, buffer = cv2.imencode('.jpg', frame, params)
+    return buffer.tobytes() if ret else None
+
+# Global state: slots make each access a fixed-offset load instead of a
+# dict hash lookup, and the field list doubles as the POST whitelist
+@dataclass(slots=True)
+class PanelState:
+    current_page: str = 'camera'
+    is_recording: bool = False
+    brightness: int = 50
+    volume: int = 50
+    alarm_hour: int = datetime.datetime.now().hour
+    alarm_minute: int = datetime.datetime.now().minute
+    alarm_set_time: str | None = None
+    temperature: float = 20.0
+
+_FIELDS = {f.name for f in fields(PanelState)}
+
+state = PanelState()
+
+# Camera setup (real primitives: shared with the OS-thread workers)
 camera = None
-camera_lock = threading.Lock()
+camera_lock = _threading.Lock()
 
-def init_camera():
-    """Initialize camera with fallback support"""
-    global camera
-    if camera is not None:
-        return camera
+# Latest encoded frame, shared by all streaming clients: one producer thread
+# captures and encodes, each client generator just waits for the newest JPEG
+_latest_jpeg = None
+_frame_cv = _threading.Condition()
+_producer_thread = None
 
-    camera_configs = [
-        (0, cv2.CAP_AVFOUNDATION),
-        (1, cv2.CAP_AVFOUNDATION),
-        (0, cv2.CAP_ANY),
-        (1, cv2.CAP_ANY),
-    ]
+# True when the camera delivers raw MJPG buffers we can forward untouched
+_passthrough = False
 
-    for cam_index, backend in camera_configs:
+# Encoded once at import: served when no camera frame exists so the MJPEG
+# connection stays alive instead of hanging until the browser reconnects
+_PLACEHOLDER = cv2.imencode('.jpg', np.zeros((480, 640, 3), np.uint8),
+                            [cv2.IMWRITE_JPEG_QUALITY, 50])[1].tobytes()
+
+def _probe_camera_index(cam_index, backends):
+    """Try to open one camera index, falling through its backends in order."""
+    for backend in backends:
         try:
             cap = cv2.VideoCapture(cam_index, backend)
             if cap.isOpened():
                 cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
                 cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+                cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+                # Prefer MJPG so the camera ships pre-compressed frames and
+                # OpenCV decodes via libjpeg-turbo instead of converting YUYV
+                cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
                 ret, frame = cap.read()
                 if ret and frame is not None:
-                    camera = cap
-                    print(f"✓ Camera {cam_index} initialized")
-                    return camera
+                    return cap
                 cap.release()
         except Exception as e:
             print(f"✗ Camera {cam_index} failed: {e}")
+    return None
+
+def init_camera():
+    """Initialize camera with fallback support.
+
+    Each index is probed on its own OS thread (a blocking open can take
+    1-2 s on AVFoundation, and would pin the eventlet hub on a green
+    thread), the first success wins and any extra capture is released.
+    Backends for the same index stay sequential so the device is never
+    opened twice at once.
+    """
+    global camera
+    if camera is not None:
+        return camera
+
+    backends = [cv2.CAP_AVFOUNDATION, cv2.CAP_ANY]
+    results = []
+    workers = [_Thread(target=lambda i=idx: results.append(
+                   (i, _probe_camera_index(i, backends))), daemon=True)
+               for idx in (0, 1)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    for idx, cap in results:
+        if cap is None:
+            continue
+        if camera is None:
+            camera = cap
+            print(f"✓ Camera {idx} initialized")
+        else:
+            cap.release()
 
+    if camera is not None:
+        _start_producer()
+        return camera
     print("⚠ No camera available")
     return None
 
-def get_camera_frame():
-    """Get current camera frame as JPEG"""
-    global camera
+_init_thread = None
+
+def _start_camera_init():
+    """Probe for a camera on a background thread (idempotent)."""
+    global _init_thread
+    if camera is None and (_init_thread is None or not _init_thread.is_alive()):
+        _init_thread = _Thread(target=init_camera, daemon=True)
+        _init_thread.start()
+
+def _start_producer():
+    """Start the capture/encode producer thread (idempotent)."""
+    global _producer_thread
+    if _producer_thread is None or not _producer_thread.is_alive():
+        _producer_thread = _Thread(target=_capture_producer, daemon=True)
+        _producer_thread.start()
+
+def _try_enable_passthrough():
+    """Try to forward the camera's native MJPG buffers without re-encoding.
+
+    Most UVC webcams already deliver MJPEG; decoding it to BGR and encoding
+    back to JPEG is two codec passes for nothing. With CAP_PROP_CONVERT_RGB=0
+    retrieve() hands back the camera's own compressed buffer - we verify the
+    JPEG magic on a probe frame and fall back to decode+encode if the
+    backend doesn't cooperate.
+    """
+    global _passthrough
     with camera_lock:
-        if camera is None or not state['is_recording']:
-            # Return placeholder image
-            return None
-
-        ret, frame = camera.read()
-        if not ret:
-            return None
-
-        # Encode frame as JPEG
-        ret, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
-        if ret:
-            return buffer.tobytes()
-    return None
+        if camera is None:
+            return
+        if int(camera.get(cv2.CAP_PROP_FOURCC)) != cv2.VideoWriter_fourcc(*'MJPG'):
+            return
+        camera.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+        ret, raw = camera.read()
+        if ret and raw is not None and raw.size >= 2:
+            head = raw.reshape(-1)[:2]
+            if head[0] == 0xFF and head[1] == 0xD8:
+                _passthrough = True
+                print("✓ MJPG passthrough enabled (streaming camera JPEG directly)")
+                return
+        # Backend ignored the flag or returned something that isn't JPEG
+        camera.set(cv2.CAP_PROP_CONVERT_RGB, 1)
+
+def _capture_producer():
+    """Continuously publish the newest camera frame as JPEG.
+
+    One encode amortizes across every connected viewer; clients never touch
+    the camera themselves, so N viewers no longer cost N reads + N encodes.
+    In passthrough mode the camera's own MJPG buffer is forwarded and no
+    encode happens at all.
+    """
+    global _latest_jpeg
+    _try_enable_passthrough()
+    while True:
+        # Only the camera read needs the lock; encoding is CPU-bound and
+        # would otherwise serialize capture behind it
+        frame = None
+        with camera_lock:
+            if camera is not None and state.is_recording:
+                # Drain the driver queue with cheap grab()s and decode only
+                # the freshest frame, so viewers never accumulate buffer lag
+                # when encoding runs slower than capture
+                for _ in range(2):
+                    camera.grab()
+                ret, frame = camera.retrieve()
+                if not ret:
+                    frame = None
+        if frame is None:
+            time.sleep(0.1)
+            continue
+
+        jpeg = frame.tobytes() if _passthrough else encode_jpeg(frame)
+        if jpeg is None:
+            continue
+        with _frame_cv:
+            _latest_jpeg = jpeg
+            _frame_cv.notify_all()
+
+def _next_frame(last_sent):
+    """Block until a frame newer than last_sent exists (or 0.2 s passes)."""
+    with _frame_cv:
+        _frame_cv.wait_for(lambda: _latest_jpeg is not last_sent, timeout=0.2)
+        return _latest_jpeg
 
 def generate_camera_stream():
-    """Generate camera frames for streaming"""
+    """Generate camera frames for streaming (shared producer output).
+
+    Each client blocks on the condition until the producer publishes a
+    frame it hasn't sent yet, so frame rate is bounded by the camera, not
+    by a polling interval, and the same buffer is never sent twice.
+    """
+    last_sent = None
     while True:
-        frame = get_camera_frame()
-        if frame:
-            yield (b'--frame\r\n'
-                   b'Content-Type: image/jpeg\r\n\r\n' + frame + b'\r\n')
+        # _frame_cv is a real condition owned by the producer's OS thread;
+        # under eventlet the blocking wait runs on the tpool so it parks
+        # only this client's greenlet, not the hub
+        if tpool is not None:
+            buf = tpool.execute(_next_frame, last_sent)
         else:
-            # Send placeholder or wait
-            time.sleep(0.1)
+            buf = _next_frame(last_sent)
+        if buf is None or buf is last_sent:
+            # No camera (or it stalled): keep the stream alive with the
+            # preencoded placeholder at ~5 FPS instead of going silent
+            yield (b'--frame\r\n'
+                   b'Content-Type: image/jpeg\r\n\r\n' + _PLACEHOLDER + b'\r\n')
+            continue
+        last_sent = buf
+        yield (b'--frame\r\n'
+               b'Content-Type: image/jpeg\r\n\r\n' + buf + b'\r\n')
 
 # Routes
 @app.route('/')
@@ -105,46 +308,72 @@ def camera_feed():
 @app.route('/api/state', methods=['GET'])
 def get_state():
     """Get current application state"""
-    return jsonify(state)
+    return jsonify(asdict(state))
 
 @app.route('/api/state', methods=['POST'])
 def update_state():
     """Update application state"""
     data = request.json
-    for key in data:
-        if key in state:
-            state[key] = data[key]
-    return jsonify({'success': True, 'state': state})
+    # One C-level set intersection instead of a membership test per key;
+    # non-object bodies (e.g. a bare JSON list) are ignored, not a 500
+    if isinstance(data, dict):
+        for key in data.keys() & _FIELDS:
+            setattr(state, key, data[key])
+    return jsonify({'success': True, 'state': asdict(state)})
 
 @app.route('/api/recording/toggle', methods=['POST'])
 def toggle_recording():
     """Toggle recording state"""
-    state['is_recording'] = not state['is_recording']
-    if state['is_recording']:
-        init_camera()
-    return jsonify({'success': True, 'is_recording': state['is_recording']})
+    state.is_recording = not state.is_recording
+    resp = {'success': True, 'is_recording': state.is_recording}
+    if state.is_recording and camera is None:
+        # Probing can block for seconds; do it off the request thread and
+        # tell the client the camera is still coming up
+        _start_camera_init()
+        resp['camera'] = 'initializing'
+    return jsonify(resp)
 
 @app.route('/api/alarm/set', methods=['POST'])
 def set_alarm():
     """Set alarm time"""
     data = request.json
-    state['alarm_hour'] = data.get('hour', state['alarm_hour'])
-    state['alarm_minute'] = data.get('minute', state['alarm_minute'])
-    state['alarm_set_time'] = f"{state['alarm_hour']:02d}:{state['alarm_minute']:02d}"
-    return jsonify({'success': True, 'alarm_time': state['alarm_set_time']})
+    state.alarm_hour = data.get('hour', state.alarm_hour)
+    state.alarm_minute = data.get('minute', state.alarm_minute)
+    state.alarm_set_time = f"{state.alarm_hour:02d}:{state.alarm_minute:02d}"
+    return jsonify({'success': True, 'alarm_time': state.alarm_set_time})
 
 # Background task for temperature simulation
+_TEMP_BASE = 20.0
+_TEMP_SLOPE = 0.8 / 60.0
+
+@socketio.on('subscribe_temp')
+def subscribe_temp():
+    """Opt a client into temperature broadcasts."""
+    join_room('subscribed')
+
 def update_temperature():
     """Simulate temperature updates"""
+    # Monotonic clock: immune to NTP jumps, and the baseline is captured
+    # once so each tick is a subtract + modulo on precomputed constants
+    t0 = time.monotonic()
+    last_broadcast = None
     while True:
-        state['temperature'] = 20.0 + 0.8 * (time.time() % 60) / 60.0
-        socketio.emit('temperature_update', {'temperature': state['temperature']})
-        time.sleep(1)
+        temp = _TEMP_BASE + _TEMP_SLOPE * ((time.monotonic() - t0) % 60)
+        state.temperature = temp
+        # Broadcast only to clients that subscribed, and only when the
+        # value crossed display precision - per-second emits to every
+        # connection are O(clients) of wasted packets
+        if last_broadcast is None or abs(temp - last_broadcast) >= 0.1:
+            socketio.emit('temperature_update',
+                          {'temperature': round(temp, 2)}, to='subscribed')
+            last_broadcast = temp
+        # socketio.sleep yields cooperatively under eventlet (and degrades
+        # to a plain sleep on the threading backend)
+        socketio.sleep(1)
 
 if __name__ == '__main__':
-    # Start temperature update thread
-    temp_thread = threading.Thread(target=update_temperature, daemon=True)
-    temp_thread.start()
+    # Start temperature update task on the SocketIO worker pool
+    socketio.start_background_task(update_temperature)
 
     # Run Flask app
     socketio.run(app, host='0.0.0.0', port=5001, debug=True)
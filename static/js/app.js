@@ -273,6 +273,8 @@ async function updateServerState(updates) {
 // Socket.IO Events
 socket.on('connect', function() {
     console.log('Connected to server');
+    // Temperature broadcasts go to an opt-in room on the server
+    socket.emit('subscribe_temp');
 });
 
 socket.on('temperature_update', function(data) {